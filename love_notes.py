@@ -1,10 +1,13 @@
 import argparse
+import functools
 import math
 import random
 import sys
+import time
 import tkinter as tk
+from collections import deque
 from tkinter import font as tkfont
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 
 DEFAULT_COLORS = [
@@ -47,6 +50,9 @@ DEFAULT_MESSAGES = [
 NOTE_SHADOW_COLOR = "#F7C6FF"
 NOTE_SHADOW_ALPHA = 0.28
 NOTE_GLOW_PADDING = 22
+# 抠色阴影窗口的背景色，这个颜色的像素完全透明
+SHADOW_KEY_COLOR = "#000000"
+SHADOW_FADE_STEPS = 25
 FADE_INTERVAL_MS = 20
 FADE_IN_DURATION_MS = 650
 
@@ -64,9 +70,16 @@ def load_messages(messages_path: Optional[str]) -> List[str]:
 
 
 def lighten_color(hex_color: str, factor: float = 0.25) -> str:
+    # 系数按百分比取整后再查缓存，避免浮点误差导致缓存失效
+    return _lighten_color_cached(hex_color, int(round(factor * 100)))
+
+
+@functools.lru_cache(maxsize=256)
+def _lighten_color_cached(hex_color: str, percent: int) -> str:
     color = hex_color.lstrip("#")
     if len(color) != 6:
         return "#F0F0F0"
+    factor = percent / 100
     red = int(color[0:2], 16)
     green = int(color[2:4], 16)
     blue = int(color[4:6], 16)
@@ -76,6 +89,30 @@ def lighten_color(hex_color: str, factor: float = 0.25) -> str:
     return f"#{red:02X}{green:02X}{blue:02X}"
 
 
+def note_theme(color: str) -> Tuple[str, str, str, str]:
+    """返回便签的 (标题栏颜色, 边框高亮色, 渐变起始色, 渐变结束色)。"""
+    theme = _COLOR_THEME.get(color)
+    if theme is None:
+        theme = (
+            lighten_color(color, 0.6),
+            lighten_color(color, 0.45),
+            lighten_color(color, 0.18),
+            lighten_color(color, 0.55),
+        )
+    return theme
+
+
+_COLOR_THEME: Dict[str, Tuple[str, str, str, str]] = {}
+_COLOR_THEME.update((base, note_theme(base)) for base in DEFAULT_COLORS)
+
+# 抠色阴影不能用窗口透明度淡入，改为按进度换用预先和白色混合好的光晕色；
+# 第 0 项就是抠色本身，完全不可见
+_SHADOW_FADE_PALETTE: Tuple[str, ...] = (SHADOW_KEY_COLOR,) + tuple(
+    lighten_color(NOTE_SHADOW_COLOR, 1 - NOTE_SHADOW_ALPHA * index / SHADOW_FADE_STEPS)
+    for index in range(1, SHADOW_FADE_STEPS + 1)
+)
+
+
 def create_shadow_window(
     master: tk.Misc,
     padding: int,
@@ -85,11 +122,30 @@ def create_shadow_window(
         shadow = tk.Toplevel(master)
         shadow.withdraw()
         shadow.overrideredirect(True)
-        shadow.attributes("-alpha", alpha)
         shadow.attributes("-topmost", False)
         canvas = tk.Canvas(shadow, highlightthickness=0, bd=0)
         canvas.pack(fill=tk.BOTH, expand=True)
+        try:
+            # 抠掉纯色背景只留下椭圆，不再走整窗 alpha 混合
+            shadow.attributes("-transparentcolor", SHADOW_KEY_COLOR)
+            shadow.configure(bg=SHADOW_KEY_COLOR)
+            canvas.configure(bg=SHADOW_KEY_COLOR)
+            keyed = True
+            fill_color = SHADOW_KEY_COLOR
+        except tk.TclError:
+            # 不支持 -transparentcolor 的平台仍用整窗透明度
+            shadow.attributes("-alpha", alpha)
+            keyed = False
+            fill_color = NOTE_SHADOW_COLOR
+        # 光晕椭圆只创建一次，之后只更新坐标和颜色
+        oval = canvas.create_oval(0, 0, 1, 1, fill=fill_color, outline="")
         shadow._canvas = canvas  # type: ignore[attr-defined]
+        shadow._oval = oval  # type: ignore[attr-defined]
+        shadow._keyed = keyed  # type: ignore[attr-defined]
+        shadow._fill = fill_color  # type: ignore[attr-defined]
+        shadow._size = None  # type: ignore[attr-defined]
+        shadow._last_geom = None  # type: ignore[attr-defined]
+        shadow._last_request = None  # type: ignore[attr-defined]
         return shadow
     except tk.TclError:
         return None
@@ -97,28 +153,97 @@ def create_shadow_window(
 
 def update_shadow_geometry(
     shadow: Optional[tk.Toplevel],
-    target: tk.Toplevel,
+    target_x: int,
+    target_y: int,
+    target_width: int,
+    target_height: int,
     padding: int,
-    fill_color: str,
+    fill_color: Optional[str] = None,
 ) -> None:
-    if shadow is None or not shadow.winfo_exists():
+    if shadow is None:
+        return
+    # 和上次完全相同的更新直接跳过，连 winfo_exists 的 Tcl 调用也省掉
+    request = (target_x, target_y, target_width, target_height, padding, fill_color)
+    if request == shadow._last_request:  # type: ignore[attr-defined]
+        return
+    if not shadow.winfo_exists():
         return
-    width = target.winfo_width()
-    height = target.winfo_height()
-    x_pos = target.winfo_x() - padding
-    y_pos = target.winfo_y() - padding
-    shadow.geometry(f"{width + padding * 2}x{height + padding * 2}+{x_pos}+{y_pos}")
+    shadow._last_request = request  # type: ignore[attr-defined]
+    width = target_width + padding * 2
+    height = target_height + padding * 2
+    x_pos = target_x - padding
+    y_pos = target_y - padding
     canvas: tk.Canvas = shadow._canvas  # type: ignore[attr-defined]
-    canvas.configure(width=width + padding * 2, height=height + padding * 2)
-    canvas.delete("all")
-    canvas.create_oval(
-        0,
-        0,
-        width + padding * 2,
-        height + padding * 2,
-        fill=fill_color,
-        outline="",
+
+    geom = f"{width}x{height}+{x_pos}+{y_pos}"
+    if geom != shadow._last_geom:  # type: ignore[attr-defined]
+        shadow.geometry(geom)
+        shadow._last_geom = geom  # type: ignore[attr-defined]
+
+    size = (width, height)
+    if size != shadow._size:  # type: ignore[attr-defined]
+        canvas.configure(width=width, height=height)
+        canvas.coords(shadow._oval, 0, 0, width, height)  # type: ignore[attr-defined]
+        shadow._size = size  # type: ignore[attr-defined]
+
+    if fill_color is not None:
+        set_shadow_fill(shadow, fill_color)
+
+
+def set_shadow_fill(shadow: tk.Toplevel, fill_color: str) -> None:
+    if fill_color == shadow._fill:  # type: ignore[attr-defined]
+        return
+    canvas: tk.Canvas = shadow._canvas  # type: ignore[attr-defined]
+    try:
+        canvas.itemconfig(shadow._oval, fill=fill_color)  # type: ignore[attr-defined]
+    except tk.TclError:
+        return
+    shadow._fill = fill_color  # type: ignore[attr-defined]
+
+
+_GRADIENT_CACHE: Dict[Tuple[int, int, str, str], tk.PhotoImage] = {}
+
+
+def gradient_image(
+    master: tk.Misc,
+    width: int,
+    height: int,
+    start_color: str,
+    end_color: str,
+) -> tk.PhotoImage:
+    """返回一张从上到下渐变的位图，相同尺寸和配色的便签共用同一张。"""
+    width = max(1, width)
+    steps = max(2, height)
+    key = (width, steps, start_color, end_color)
+    image = _GRADIENT_CACHE.get(key)
+    if image is not None:
+        return image
+
+    start_red, start_green, start_blue = (
+        int(start_color[1:3], 16),
+        int(start_color[3:5], 16),
+        int(start_color[5:7], 16),
     )
+    delta_red = int(end_color[1:3], 16) - start_red
+    delta_green = int(end_color[3:5], 16) - start_green
+    delta_blue = int(end_color[5:7], 16) - start_blue
+    last = steps - 1
+    colors = [
+        f"#{start_red + delta_red * index // last:02X}"
+        f"{start_green + delta_green * index // last:02X}"
+        f"{start_blue + delta_blue * index // last:02X}"
+        for index in range(steps)
+    ]
+
+    # 相邻同色的行合并成一个色带，一次 put 填满
+    image = tk.PhotoImage(master=master, width=width, height=steps)
+    band_start = 0
+    for index in range(1, steps + 1):
+        if index == steps or colors[index] != colors[band_start]:
+            image.put(colors[band_start], to=(0, band_start, width, index))
+            band_start = index
+    _GRADIENT_CACHE[key] = image
+    return image
 
 
 def draw_vertical_gradient(
@@ -130,34 +255,151 @@ def draw_vertical_gradient(
     start_color: str,
     end_color: str,
     tag: str = "gradient",
-) -> None:
-    steps = max(2, y1 - y0)
-    start_rgb = (
-        int(start_color[1:3], 16),
-        int(start_color[3:5], 16),
-        int(start_color[5:7], 16),
-    )
-    end_rgb = (
-        int(end_color[1:3], 16),
-        int(end_color[3:5], 16),
-        int(end_color[5:7], 16),
-    )
+) -> int:
+    image = gradient_image(canvas, x1 - x0, y1 - y0, start_color, end_color)
     canvas.delete(tag)
-    for index in range(steps):
-        ratio = index / (steps - 1)
-        red = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-        green = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-        blue = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
-        color = f"#{red:02X}{green:02X}{blue:02X}"
-        canvas.create_rectangle(
-            x0,
-            y0 + index,
-            x1,
-            y0 + index + 1,
-            outline="",
-            fill=color,
-            tags=tag,
-        )
+    return canvas.create_image(x0, y0, anchor="nw", image=image, tags=tag)
+
+
+_SHARED_FONTS: Dict[Tuple[int, str], tkfont.Font] = {}
+
+
+def shared_font(master: tk.Misc, size: int, weight: str = "normal") -> tkfont.Font:
+    """所有便签共用同一个字体对象，避免每个便签都新建一次。"""
+    key = (size, weight)
+    text_font = _SHARED_FONTS.get(key)
+    if text_font is None:
+        text_font = tkfont.Font(root=master, family="Microsoft YaHei", size=size, weight=weight)
+        _SHARED_FONTS[key] = text_font
+    return text_font
+
+
+AnimationUpdate = Callable[[float], None]
+
+
+def ease_in_out_quad(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+_EASE_CACHE: Dict[int, Tuple[float, ...]] = {}
+
+
+def ease_table(steps: int) -> Tuple[float, ...]:
+    """按帧预先算好的缓动进度，第 i 项对应进度 i / steps。"""
+    table = _EASE_CACHE.get(steps)
+    if table is None:
+        table = tuple(ease_in_out_quad(index / steps) for index in range(steps + 1))
+        _EASE_CACHE[steps] = table
+    return table
+
+
+class AnimationDriver:
+    """用同一个 after 循环逐帧推进所有正在进行的动画。
+
+    每帧实际间隔比预定的长多少会被记下来，下一帧的等待时间扣掉最近
+    半秒内的平均延迟；动画进度按真实流逝时间计算，掉帧时不会拖慢动画。
+    计时从动画第一次被推进时开始，注册后主线程的阻塞不会吞掉开头几帧。
+    """
+
+    DELAY_WINDOW_S = 0.5
+
+    def __init__(self, frame_interval_ms: int = FADE_INTERVAL_MS) -> None:
+        self.frame_interval_ms = frame_interval_ms
+        self._animations: List[
+            Tuple[tk.Misc, AnimationUpdate, Optional[float], float, Optional[Callable[[], None]]]
+        ] = []
+        self._root: Optional[tk.Misc] = None
+        self._tick_command = ""
+        self._after_id: Optional[str] = None
+        self._last_tick: Optional[float] = None
+        self._last_wait_ms = frame_interval_ms
+        self._delays: Deque[Tuple[float, float]] = deque()
+        self._delay_total = 0.0
+
+    def add(
+        self,
+        widget: tk.Misc,
+        update: AnimationUpdate,
+        duration_ms: int,
+        on_complete: Optional[Callable[[], None]] = None,
+    ) -> None:
+        duration_s = max(1, duration_ms) / 1000
+        self._animations.append((widget, update, None, duration_s, on_complete))
+        if self._root is None:
+            self._root = widget.nametowidget(".")
+            # Misc.after 每次都会包一层闭包并注册新的 Tcl 命令，这里只注册一次反复使用
+            self._tick_command = self._root.register(self._tick)
+        if self._after_id is None:
+            self._schedule(self.frame_interval_ms)
+
+    def _schedule(self, wait_ms: int) -> None:
+        if self._root is None:
+            return
+        self._last_wait_ms = wait_ms
+        self._after_id = self._root.tk.call("after", wait_ms, self._tick_command)
+
+    def _record_delay(self, now: float) -> None:
+        if self._last_tick is not None:
+            delay_ms = (now - self._last_tick) * 1000 - self._last_wait_ms
+            self._delays.append((now, delay_ms))
+            self._delay_total += delay_ms
+        while self._delays and now - self._delays[0][0] > self.DELAY_WINDOW_S:
+            self._delay_total -= self._delays.popleft()[1]
+        self._last_tick = now
+
+    def _next_wait_ms(self) -> int:
+        if not self._delays:
+            return self.frame_interval_ms
+        average_delay = self._delay_total / len(self._delays)
+        return max(1, int(self.frame_interval_ms - average_delay))
+
+    def _tick(self) -> None:
+        self._after_id = None
+        now = time.perf_counter()
+        self._record_delay(now)
+        animations, self._animations = self._animations, []
+        running = []
+        finished: List[Callable[[], None]] = []
+
+        for entry in animations:
+            widget, update, started, duration_s, on_complete = entry
+            if started is None:
+                # 第一帧按已经过了一帧间隔来算，和逐帧推进时的起点一致
+                started = now - self.frame_interval_ms / 1000
+                entry = (widget, update, started, duration_s, on_complete)
+            done = True
+            try:
+                if widget.winfo_exists():
+                    progress = min(1.0, (now - started) / duration_s)
+                    update(progress)
+                    done = progress >= 1.0
+            except tk.TclError:
+                pass
+            if not done:
+                running.append(entry)
+            elif on_complete is not None:
+                finished.append(on_complete)
+
+        # 本帧期间新加入的动画排在后面，回调里再加入的也不会丢失
+        self._animations[:0] = running
+        for callback in finished:
+            # 单个回调出错只上报，不能让共享循环停下来
+            try:
+                callback()
+            except Exception:
+                if self._root is not None:
+                    self._root.report_callback_exception(*sys.exc_info())
+
+        if not self._animations:
+            # 空闲期间的间隔不计入延迟统计
+            self._last_tick = None
+            self._delays.clear()
+            self._delay_total = 0.0
+        elif self._after_id is None:
+            self._schedule(self._next_wait_ms())
+
+
+_ANIMATIONS = AnimationDriver()
 
 
 class StickyNote(tk.Toplevel):
@@ -173,6 +415,7 @@ class StickyNote(tk.Toplevel):
         title_text: str,
         position: Tuple[int, int],
         on_close: Optional[Callable[["StickyNote"], None]] = None,
+        auto_show: bool = True,
     ) -> None:
         super().__init__(master)
         self.overrideredirect(True)
@@ -181,67 +424,68 @@ class StickyNote(tk.Toplevel):
         self.configure(bg=color)
         self.attributes("-topmost", stay_on_top)
         self._drag_origin: Optional[Tuple[int, int, int, int]] = None
+        self._drag_position: Tuple[int, int] = (0, 0)
+        self._shadow_update_pending = False
+        self._flush_shadow_command = self.register(self._flush_shadow)
         self._on_close = on_close
+        # 窗口位置和尺寸只由本类修改，缓存下来避免每帧 winfo_* 查询
+        self._cur_w, self._cur_h = width, height
+        self._cur_x, self._cur_y = position
         self._shadow = create_shadow_window(self, padding=NOTE_GLOW_PADDING, alpha=0.0)
 
-        title_color = lighten_color(color, 0.6)
-        border_frame = tk.Frame(
+        title_color, highlight_color, gradient_start, gradient_end = note_theme(color)
+        self._border_frame = border_frame = tk.Frame(
             self,
             bg=color,
             bd=0,
             highlightthickness=2,
-            highlightbackground=lighten_color(color, 0.45),
-            highlightcolor=lighten_color(color, 0.45),
+            highlightbackground=highlight_color,
+            highlightcolor=highlight_color,
         )
         border_frame.pack(fill=tk.BOTH, expand=True)
 
-        title_bar = tk.Frame(border_frame, bg=title_color, height=30)
+        self._title_bar = title_bar = tk.Frame(border_frame, bg=title_color, height=30)
         title_bar.pack(fill=tk.X, side=tk.TOP)
 
-        title_label = tk.Label(
+        self._title_label = title_label = tk.Label(
             title_bar,
             text=title_text,
             bg=title_color,
             fg="#3F3F3F",
-            font=("Microsoft YaHei", 10, "bold"),
+            font=shared_font(self, 10, "bold"),
         )
         title_label.pack(side=tk.LEFT, padx=(14, 0))
 
-        close_button = tk.Label(
+        self._close_button = close_button = tk.Label(
             title_bar,
             text="×",
             bg=title_color,
             fg="#555555",
-            font=("Microsoft YaHei", 12, "bold"),
+            font=shared_font(self, 12, "bold"),
             cursor="hand2",
         )
         close_button.pack(side=tk.RIGHT, padx=(0, 12))
         close_button.bind("<Button-1>", lambda _event: self.destroy())
 
-        body_canvas = tk.Canvas(
+        self._body_canvas = body_canvas = tk.Canvas(
             border_frame,
             bg=color,
             bd=0,
             highlightthickness=0,
         )
         body_canvas.pack(fill=tk.BOTH, expand=True, padx=18, pady=(14, 18))
-        draw_vertical_gradient(
+        self._gradient_item = draw_vertical_gradient(
             body_canvas,
             0,
             0,
             width - 36,
             height - 50,
-            start_color=lighten_color(color, 0.18),
-            end_color=lighten_color(color, 0.55),
+            start_color=gradient_start,
+            end_color=gradient_end,
             tag="note-bg",
         )
 
-        text_font = tkfont.Font(
-            family="Microsoft YaHei",
-            size=font_size,
-            weight="normal",
-        )
-        text_label = tk.Label(
+        self._text_label = text_label = tk.Label(
             body_canvas,
             text=text,
             bg=color,
@@ -249,7 +493,7 @@ class StickyNote(tk.Toplevel):
             justify=tk.LEFT,
             anchor="nw",
             wraplength=width - 64,
-            font=text_font,
+            font=shared_font(self, font_size),
         )
         body_canvas.create_window(10, 10, anchor="nw", window=text_label)
 
@@ -261,10 +505,42 @@ class StickyNote(tk.Toplevel):
         text_label.bind("<Double-Button-1>", lambda _event: self.destroy())
         self.bind("<Escape>", lambda _event: self.destroy())
 
-        x_pos, y_pos = position
-        self.geometry(f"{width}x{height}+{x_pos}+{y_pos}")
+        self.geometry(f"{width}x{height}+{self._cur_x}+{self._cur_y}")
+        if auto_show:
+            self.show()
+        else:
+            self.withdraw()
+
+    def show(self) -> None:
+        self.deiconify()
         self.fade_in(FADE_IN_DURATION_MS, on_complete=self._lift_with_shadow)
 
+    def reset(self, text: str, color: str, position: Tuple[int, int]) -> None:
+        """复用已有便签：换上新的文字、配色和位置，不重建任何控件。"""
+        title_color, highlight_color, gradient_start, gradient_end = note_theme(color)
+        self.configure(bg=color)
+        self._border_frame.configure(
+            bg=color,
+            highlightbackground=highlight_color,
+            highlightcolor=highlight_color,
+        )
+        for widget in (self._title_bar, self._title_label, self._close_button):
+            widget.configure(bg=title_color)
+        self._body_canvas.configure(bg=color)
+        self._body_canvas.itemconfig(
+            self._gradient_item,
+            image=gradient_image(
+                self._body_canvas,
+                self._cur_w - 36,
+                self._cur_h - 50,
+                gradient_start,
+                gradient_end,
+            ),
+        )
+        self._text_label.configure(text=text, bg=color)
+        self._move_to(*position)
+        self._update_shadow()
+
     def destroy(self) -> None:  # type: ignore[override]
         if self._on_close is not None:
             callback = self._on_close
@@ -275,9 +551,10 @@ class StickyNote(tk.Toplevel):
         super().destroy()
 
     def _start_move(self, event: tk.Event) -> None:
-        self._drag_origin = (event.x_root, event.y_root, self.winfo_x(), self.winfo_y())
+        self._drag_origin = (event.x_root, event.y_root, self._cur_x, self._cur_y)
+        self._drag_position = (self._cur_x, self._cur_y)
 
-    def _drag_move(self, event: tk.Event) -> None:
+    def _drag_move(self, event: tk.Event, min_distance: int = 2) -> None:
         if not self._drag_origin:
             return
         origin_x, origin_y, window_x, window_y = self._drag_origin
@@ -285,44 +562,68 @@ class StickyNote(tk.Toplevel):
         delta_y = event.y_root - origin_y
         new_x = window_x + delta_x
         new_y = window_y + delta_y
-        self.geometry(f"+{new_x}+{new_y}")
-        update_shadow_geometry(self._shadow, self, NOTE_GLOW_PADDING, NOTE_SHADOW_COLOR)
-
-    def _stop_move(self, _event: tk.Event) -> None:
+        last_x, last_y = self._drag_position
+        moved_sq = (new_x - last_x) ** 2 + (new_y - last_y) ** 2
+        if moved_sq == 0 or moved_sq < min_distance * min_distance:
+            return
+        self._drag_position = (new_x, new_y)
+        self._move_to(new_x, new_y)
+        # 拖动事件很密集，光晕只在空闲时合并更新一次
+        if not self._shadow_update_pending:
+            self._shadow_update_pending = True
+            self.tk.call("after", "idle", self._flush_shadow_command)
+
+    def _stop_move(self, event: tk.Event) -> None:
+        # 松手时补上被阈值跳过的最后一点位移
+        self._drag_move(event, min_distance=0)
         self._drag_origin = None
 
+    def _flush_shadow(self) -> None:
+        self._shadow_update_pending = False
+        if self.winfo_exists():
+            self._update_shadow()
+
+    def _move_to(self, x_pos: int, y_pos: int) -> None:
+        self._cur_x, self._cur_y = x_pos, y_pos
+        self.geometry(f"+{x_pos}+{y_pos}")
+
+    def _update_shadow(self) -> None:
+        update_shadow_geometry(
+            self._shadow,
+            self._cur_x,
+            self._cur_y,
+            self._cur_w,
+            self._cur_h,
+            NOTE_GLOW_PADDING,
+        )
+
     def _lift_with_shadow(self) -> None:
-        update_shadow_geometry(self._shadow, self, NOTE_GLOW_PADDING, NOTE_SHADOW_COLOR)
+        if not self.winfo_exists():
+            return
+        self._update_shadow()
         if self._shadow is not None and self._shadow.winfo_exists():
             self._shadow.lower()
         self.lift()
 
     def fade_in(self, duration_ms: int, on_complete: Optional[Callable[[], None]] = None) -> None:
-        steps = max(1, duration_ms // FADE_INTERVAL_MS)
         max_alpha = 0.94
-        increment = max_alpha / steps
-
-        def step(index: int = 0) -> None:
-            if not self.winfo_exists():
-                if on_complete is not None:
-                    on_complete()
-                return
 
-            new_alpha = min(max_alpha, (index + 1) * increment)
+        def update(progress: float) -> None:
+            new_alpha = max_alpha * progress
             self.attributes("-alpha", new_alpha)
-            if self._shadow is not None and self._shadow.winfo_exists():
-                self._shadow.attributes(
+            shadow = self._shadow
+            if shadow is None:
+                return
+            if shadow._keyed:  # type: ignore[attr-defined]
+                # 换椭圆颜色只是画布重绘，不会触发窗口合成
+                set_shadow_fill(shadow, _SHADOW_FADE_PALETTE[int(progress * SHADOW_FADE_STEPS)])
+            elif shadow.winfo_exists():
+                shadow.attributes(
                     "-alpha",
                     min(NOTE_SHADOW_ALPHA, new_alpha * NOTE_SHADOW_ALPHA),
                 )
 
-            if new_alpha >= max_alpha:
-                if on_complete is not None:
-                    on_complete()
-            else:
-                self.after(FADE_INTERVAL_MS, lambda: step(index + 1))
-
-        step()
+        _ANIMATIONS.add(self, update, duration_ms, on_complete)
 
     def animate_to_position(
         self,
@@ -337,43 +638,37 @@ class StickyNote(tk.Toplevel):
                 on_complete()
             return
 
-        start_x, start_y = self.winfo_x(), self.winfo_y()
-        steps = max(1, duration_ms // FADE_INTERVAL_MS)
+        start_x, start_y = self._cur_x, self._cur_y
         total_rotation = rotation_count * 360
+        steps = max(1, duration_ms // FADE_INTERVAL_MS)
+        eased = ease_table(steps)
+
+        # 每帧摆动角度等距递增，用旋转递推生成整张偏移表，只需一次 sin/cos
+        angle_step = math.radians(total_rotation / steps) * 3
+        cos_step, sin_step = math.cos(angle_step), math.sin(angle_step)
+        sin_angle, cos_angle = 0.0, 1.0
+        swing: List[Tuple[float, float]] = []
+        for eased_progress in eased:
+            swing_factor = (1 - eased_progress) * 3.0
+            swing.append((sin_angle * swing_factor, cos_angle * swing_factor))
+            sin_angle, cos_angle = (
+                sin_angle * cos_step + cos_angle * sin_step,
+                cos_angle * cos_step - sin_angle * sin_step,
+            )
 
-        def ease_in_out_quad(t: float) -> float:
-            return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
-
-        def step(index: int = 0) -> None:
-            if not self.winfo_exists():
-                if on_complete:
-                    on_complete()
-                return
-
-            progress = (index + 1) / steps
-            eased_progress = ease_in_out_quad(progress)
+        def update(progress: float) -> None:
+            frame = int(progress * steps + 0.5)
+            eased_progress = eased[frame]
+            offset_x, offset_y = swing[frame]
 
             new_x = start_x + (target_x - start_x) * eased_progress
             new_y = start_y + (target_y - start_y) * eased_progress
 
-            rotation_angle = progress * total_rotation
-            angle_rad = math.radians(rotation_angle)
-            swing_factor = (1 - eased_progress) * 3.0
-            offset_x = math.sin(angle_rad * 3) * swing_factor
-            offset_y = math.cos(angle_rad * 3) * swing_factor
+            # 最后一帧缓动进度为 1、摆动为 0，已经正好落在目标位置
+            self._move_to(int(new_x + offset_x), int(new_y + offset_y))
+            self._update_shadow()
 
-            self.geometry(f"+{int(new_x + offset_x)}+{int(new_y + offset_y)}")
-            update_shadow_geometry(self._shadow, self, NOTE_GLOW_PADDING, NOTE_SHADOW_COLOR)
-
-            if index + 1 >= steps:
-                self.geometry(f"+{int(target_x)}+{int(target_y)}")
-                update_shadow_geometry(self._shadow, self, NOTE_GLOW_PADDING, NOTE_SHADOW_COLOR)
-                if on_complete:
-                    on_complete()
-            else:
-                self.after(FADE_INTERVAL_MS, lambda: step(index + 1))
-
-        step()
+        _ANIMATIONS.add(self, update, duration_ms, on_complete)
 
 
 def generate_positions(
@@ -394,18 +689,21 @@ def generate_positions(
     cell_width = screen_width / cols
     cell_height = screen_height / rows
 
-    for i in range(count):
-        col = i % cols
-        row = i // cols
+    # 抖动幅度和边界与格子无关，提到循环外只算一次
+    jitter_x = (cell_width - note_width) / 2
+    jitter_y = (cell_height - note_height) / 2
+    max_x = screen_width - note_width - NOTE_GLOW_PADDING
+    max_y = screen_height - note_height - NOTE_GLOW_PADDING
+    uniform = random.uniform
 
-        jitter_x = (cell_width - note_width) / 2
-        jitter_y = (cell_height - note_height) / 2
+    for i in range(count):
+        row, col = divmod(i, cols)
 
-        x = col * cell_width + random.uniform(-jitter_x, jitter_x) + jitter_x
-        y = row * cell_height + random.uniform(-jitter_y, jitter_y) + jitter_y
+        x = col * cell_width + uniform(-jitter_x, jitter_x) + jitter_x
+        y = row * cell_height + uniform(-jitter_y, jitter_y) + jitter_y
 
-        x = max(NOTE_GLOW_PADDING, min(x, screen_width - note_width - NOTE_GLOW_PADDING))
-        y = max(NOTE_GLOW_PADDING, min(y, screen_height - note_height - NOTE_GLOW_PADDING))
+        x = max(NOTE_GLOW_PADDING, min(x, max_x))
+        y = max(NOTE_GLOW_PADDING, min(y, max_y))
 
         positions.append((int(x), int(y)))
 
@@ -416,10 +714,30 @@ def generate_positions(
 def pick_messages(messages: Sequence[str], amount: int) -> List[str]:
     if not messages:
         return []
-    chosen: List[str] = []
-    for _ in range(amount):
-        chosen.append(random.choice(messages))
-    return chosen
+    return random.choices(messages, k=amount)
+
+
+@functools.lru_cache(maxsize=8)
+def heart_curve(count: int) -> Tuple[Tuple[float, float], ...]:
+    """心形线上等角度分布的 count 个单位坐标，同一数量只计算一次。"""
+    points: List[Tuple[float, float]] = []
+    # 倍角用切比雪夫恒等式由 cos(t) 推出，每个点只需一次 sin 和一次 cos
+    angle_step = 2.0 * math.pi / count
+    for i in range(count):
+        t = i * angle_step
+        sin_t = math.sin(t)
+        cos_t = math.cos(t)
+        cos_sq = cos_t * cos_t
+
+        x_base = 16 * sin_t * sin_t * sin_t
+        y_base = (
+            13 * cos_t
+            - 5 * (2 * cos_sq - 1)
+            - 2 * (4 * cos_sq - 3) * cos_t
+            - (8 * cos_sq * (cos_sq - 1) + 1)
+        )
+        points.append((x_base, y_base))
+    return tuple(points)
 
 
 def generate_heart_positions(
@@ -448,17 +766,7 @@ def generate_heart_positions(
     offset_x = screen_width / 2
     offset_y = screen_height / 2 - 80
 
-    for i in range(count):
-        t = (i / count) * 2.0 * math.pi
-
-        x_base = 16 * math.sin(t) ** 3
-        y_base = (
-            13 * math.cos(t)
-            - 5 * math.cos(2 * t)
-            - 2 * math.cos(3 * t)
-            - math.cos(4 * t)
-        )
-
+    for x_base, y_base in heart_curve(count):
         # 在曲线附近做轻微抖动，让边缘更柔和
         radial = 0.94 + random.random() * 0.08
         x = x_base * radial
@@ -474,6 +782,8 @@ def generate_heart_positions(
 
 class StickyWallApp:
     HEART_DELAY_MS = 250
+    # interval 为 0 时一次创建的便签数，整批布局完成后再一起显示
+    BATCH_SIZE = 8
 
     def __init__(
         self,
@@ -496,52 +806,67 @@ class StickyWallApp:
         self.stay_on_top = stay_on_top
         self.title_text = title_text
         self.interval_ms = max(0, interval_ms)
+        self._screen_w = root.winfo_screenwidth()
+        self._screen_h = root.winfo_screenheight()
         self._index = 0
         self._creation_cancelled = False
         self._merge_scheduled = False
 
-        self.sticky_notes: List[StickyNote] = []
+        # 用 dict 当有序集合：增删 O(1)，遍历仍按创建顺序，--seed 时合并布局可复现
+        self.sticky_notes: Dict[StickyNote, None] = {}
         self._total = len(self.texts)
 
         if self._total == 0:
             self._schedule_merge()
         else:
             initial_delay = 150
-            self.root.after(initial_delay, self._create_single_note)
+            self.root.after(initial_delay, self._create_note_batch)
 
-    def _create_single_note(self) -> None:
+    def _create_note_batch(self) -> None:
         if self._creation_cancelled or self._index >= self._total:
             return
 
-        note = StickyNote(
-            master=self.root,
-            text=self.texts[self._index],
-            color=random.choice(DEFAULT_COLORS),
-            width=self.width,
-            height=self.height,
-            font_size=self.font_size,
-            stay_on_top=self.stay_on_top,
-            title_text=self.title_text,
-            position=self.positions[self._index],
-            on_close=self._handle_note_close,
-        )
-        self.sticky_notes.append(note)
-        self._index += 1
+        batching = self.interval_ms <= 0
+        batch_size = self.BATCH_SIZE if batching else 1
+        batch: List[StickyNote] = []
+        while len(batch) < batch_size and self._index < self._total:
+            note = StickyNote(
+                master=self.root,
+                text=self.texts[self._index],
+                color=random.choice(DEFAULT_COLORS),
+                width=self.width,
+                height=self.height,
+                font_size=self.font_size,
+                stay_on_top=self.stay_on_top,
+                title_text=self.title_text,
+                position=self.positions[self._index],
+                on_close=self._handle_note_close,
+                auto_show=not batching,
+            )
+            self.sticky_notes[note] = None
+            batch.append(note)
+            self._index += 1
+
+        if batching:
+            # 整批便签先在隐藏状态下完成布局，再一次性映射到屏幕上
+            self.root.update_idletasks()
+            for note in batch:
+                note.show()
 
         if self._index >= self._total:
             self.root.after(FADE_IN_DURATION_MS, self._schedule_merge)
             return
 
         if self.interval_ms <= 0:
-            self.root.after_idle(self._create_single_note)
+            self.root.after_idle(self._create_note_batch)
         else:
-            self.root.after(self.interval_ms, self._create_single_note)
+            self.root.after(self.interval_ms, self._create_note_batch)
 
     def _handle_note_close(self, note: "StickyNote") -> None:
-        if note in self.sticky_notes:
-            self.sticky_notes.remove(note)
+        self.sticky_notes.pop(note, None)
 
-        if not self._merge_scheduled and not any(n.winfo_exists() for n in self.sticky_notes):
+        # 便签销毁时会立刻被移除，为空即表示全部关闭
+        if not self._merge_scheduled and not self.sticky_notes:
             self._schedule_merge()
 
     def _schedule_merge(self) -> None:
@@ -556,13 +881,10 @@ class StickyWallApp:
         if not active_notes:
             return
 
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-
         heart_positions = generate_heart_positions(
             count=len(active_notes),
-            screen_width=screen_width,
-            screen_height=screen_height,
+            screen_width=self._screen_w,
+            screen_height=self._screen_h,
             note_width=self.width,
             note_height=self.height,
         )